@@ -1,26 +1,43 @@
 """DTEK Python Project Package"""
 
-from dotenv import load_dotenv
 import os
-from pathlib import Path
-
-# Get project root
-PROJECT_ROOT = Path(__file__).parent.parent
-
-# 1. Load base .env
-base_env = PROJECT_ROOT / '.env'
-if base_env.exists():
-    load_dotenv(str(base_env), override=True)
-
-# 2. Load mode-specific .env based on APP_MODE
-app_mode = os.getenv('APP_MODE', 'test')
-if app_mode == 'test':
-    test_env = PROJECT_ROOT / '.env.test'
-    if test_env.exists():
-        load_dotenv(str(test_env), override=True)
-elif app_mode == 'production':
-    prod_env = PROJECT_ROOT / '.env.production'
-    if prod_env.exists():
-        load_dotenv(str(prod_env), override=True)
+
+# Get project root (plain string - avoids building Path objects at import)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_BOOTSTRAPPED = False
+
+
+def _bootstrap_env():
+    """
+    Load .env files into the environment.
+
+    Runs on first call instead of at import so that merely importing
+    src submodules (e.g. from a cron entry point or the test suite)
+    doesn't pay dotenv parsing and file stat costs.
+    """
+    global _BOOTSTRAPPED
+    if _BOOTSTRAPPED:
+        return
+    _BOOTSTRAPPED = True
+
+    from dotenv import load_dotenv
+
+    # 1. Load base .env
+    base_env = os.path.join(PROJECT_ROOT, '.env')
+    if os.path.exists(base_env):
+        load_dotenv(base_env, override=True)
+
+    # 2. Load mode-specific .env based on APP_MODE
+    app_mode = os.getenv('APP_MODE', 'test')
+    if app_mode == 'test':
+        test_env = os.path.join(PROJECT_ROOT, '.env.test')
+        if os.path.exists(test_env):
+            load_dotenv(test_env, override=True)
+    elif app_mode == 'production':
+        prod_env = os.path.join(PROJECT_ROOT, '.env.production')
+        if os.path.exists(prod_env):
+            load_dotenv(prod_env, override=True)
+
 
 __version__ = "0.1.0"
@@ -1,9 +1,40 @@
 """Configuration manager for handling different environments."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Dict, Optional, Tuple
+from dotenv import dotenv_values
+
+# Parsed .env files keyed by path, tagged with the mtime they were read
+# at, so repeated Config() constructions don't re-tokenize unchanged files
+_ENV_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+
+def _read_env_file(path: Path) -> Dict[str, str]:
+    """Parse an env file, reusing the cached result while its mtime matches."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+
+    cached = _ENV_CACHE.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+    _ENV_CACHE[str(path)] = (mtime, values)
+    return values
+
+
+_CACHED_GETTERS = []
+
+
+def _cached_getter(func):
+    """Memoize a zero-argument getter; cleared by Config.invalidate_caches."""
+    cached = functools.lru_cache(maxsize=1)(func)
+    _CACHED_GETTERS.append(cached)
+    return cached
 
 
 class Config:
@@ -42,29 +73,34 @@ class Config:
         # Load the appropriate .env file
         self._load_env_file()
 
+        # The environment may have changed under the memoized getters
+        self.invalidate_caches()
+
     def _load_env_file(self):
         """Load environment variables from the appropriate .env file."""
-        # First, load .env (base/common variables)
+        # First, load .env (base/common variables, no override)
         base_env_path = Path(__file__).parent.parent / '.env'
-        if base_env_path.exists():
-            load_dotenv(base_env_path, override=False)
-        
+        for key, value in _read_env_file(base_env_path).items():
+            os.environ.setdefault(key, value)
+
         # Then, load mode-specific file (overrides)
         env_file = self.MODES[self.mode]
         env_path = Path(__file__).parent.parent / env_file
-        
+
         if env_path.exists() and env_file != '.env':
-            load_dotenv(env_path, override=True)
+            os.environ.update(_read_env_file(env_path))
             print(f"Loaded configuration: .env + {env_file} (mode: {self.mode})")
         else:
             print(f"Loaded configuration from .env (mode: {self.mode})")
 
     @staticmethod
+    @_cached_getter
     def get_mode() -> str:
         """Get current application mode."""
         return os.getenv('APP_MODE', 'development')
 
     @staticmethod
+    @_cached_getter
     def get_telegram_token() -> str:
         """Get Telegram bot token."""
         token = os.getenv('TELEGRAM_BOT_TOKEN')
@@ -73,6 +109,7 @@ class Config:
         return token
 
     @staticmethod
+    @_cached_getter
     def get_telegram_chat_id() -> str:
         """Get default Telegram chat ID."""
         chat_id = os.getenv('TELEGRAM_CHAT_ID')
@@ -81,20 +118,29 @@ class Config:
         return chat_id
 
     @staticmethod
+    @_cached_getter
     def is_debug() -> bool:
         """Check if debug mode is enabled."""
         return os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes')
 
     @staticmethod
+    @_cached_getter
     def get_log_level() -> str:
         """Get logging level."""
         return os.getenv('LOG_LEVEL', 'INFO')
 
     @staticmethod
+    @_cached_getter
     def get_environment() -> str:
         """Get environment name."""
         return os.getenv('ENVIRONMENT', 'development')
 
+    @staticmethod
+    def invalidate_caches():
+        """Clear memoized getters after the environment changes."""
+        for cached in _CACHED_GETTERS:
+            cached.cache_clear()
+
     @classmethod
     def switch_mode(cls, mode: str) -> 'Config':
         """
@@ -122,11 +168,12 @@ class Config:
 
     def get_all_settings(self) -> dict:
         """Get all current settings."""
+        token = self.get_telegram_token()
         return {
             'mode': self.mode,
             'environment': self.get_environment(),
             'debug': self.is_debug(),
             'log_level': self.get_log_level(),
-            'bot_token': self.get_telegram_token()[:10] + '***' if self.get_telegram_token() else None,
+            'bot_token': token[:10] + '***' if token else None,
             'chat_id': self.get_telegram_chat_id(),
         }
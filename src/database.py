@@ -1,85 +1,534 @@
 """Power Monitor Database Management using SQLite."""
 
+import itertools
+import json
+import queue
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
+from enum import IntEnum
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
+
+
+class EventType(IntEnum):
+    """Integer codes stored in power_events.event_type."""
+    ONLINE = 1
+    OFFLINE = 2
+    DRAFT_CONFIRMED = 3
+
+
+# String names stay at the API boundary: callers still pass and receive
+# 'online'/'offline'/'draft_confirmed', only the storage is integer
+_EVENT_TYPE_CODES = {
+    'online': EventType.ONLINE.value,
+    'offline': EventType.OFFLINE.value,
+    'draft_confirmed': EventType.DRAFT_CONFIRMED.value,
+}
+_EVENT_TYPE_NAMES = {code: name for name, code in _EVENT_TYPE_CODES.items()}
+
+_OFFLINE = EventType.OFFLINE.value
+
+# Bump when init_db's schema changes; databases already stamped with the
+# current version skip table/index creation and migrations entirely
+_SCHEMA_VERSION = 6
+
+
+def _event_code(event_type: Union[str, int]) -> int:
+    """Map an event type name (or code) to its integer storage code."""
+    if isinstance(event_type, str):
+        try:
+            return _EVENT_TYPE_CODES[event_type]
+        except KeyError:
+            raise ValueError(f"Unknown event type: {event_type!r}") from None
+    return int(event_type)
+
+# Columns returned by the event readers; used both to build the SELECT
+# projection and to turn the fetched tuples into dicts. The wide TEXT
+# columns (message, created_at) stay out of the default projection so
+# they aren't read and decoded when callers don't need them.
+_EVENT_COLUMNS = (
+    'id', 'event_type', 'timestamp', 'event_datetime',
+    'duration_seconds', 'draft_confirmed'
+)
+_EVENT_COLUMNS_WITH_MESSAGE = _EVENT_COLUMNS + ('message',)
+
+_EVENT_PROJECTION = ', '.join(_EVENT_COLUMNS)
+_EVENT_PROJECTION_WITH_MESSAGE = ', '.join(_EVENT_COLUMNS_WITH_MESSAGE)
+
+# SQL for the hot paths as module constants: identical string objects on
+# every call, so sqlite3's per-connection prepared-statement cache hits
+# instead of re-parsing and re-planning
+_SQL_INSERT_EVENT = '''
+    INSERT INTO power_events
+    (event_type, timestamp, duration_seconds, message, draft_confirmed)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_SQL_GET_EVENTS = f'''
+    SELECT {_EVENT_PROJECTION} FROM power_events
+    WHERE timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+
+_SQL_GET_EVENTS_TYPED = f'''
+    SELECT {_EVENT_PROJECTION} FROM power_events
+    WHERE timestamp > ? AND event_type = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+
+_SQL_GET_EVENTS_FULL = f'''
+    SELECT {_EVENT_PROJECTION_WITH_MESSAGE} FROM power_events
+    WHERE timestamp > ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+
+_SQL_GET_EVENTS_TYPED_FULL = f'''
+    SELECT {_EVENT_PROJECTION_WITH_MESSAGE} FROM power_events
+    WHERE timestamp > ? AND event_type = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+
+_SQL_RECENT_OFFLINE = f'''
+    SELECT duration_seconds FROM power_events
+    WHERE event_type = {_OFFLINE}
+    ORDER BY timestamp DESC
+    LIMIT 1
+'''
+
+_SQL_STATS_TODAY = '''
+    SELECT total_outages, total_offline_seconds, average_offline_seconds
+    FROM power_stats
+    WHERE date = ?
+'''
+
+_STATS_RANGE_KEYS = (
+    'date', 'outages', 'total_offline_seconds', 'average_offline_seconds'
+)
+
+# NULL handling and the per-day average are computed in SQL so Python
+# does no per-row arithmetic on the way out
+_SQL_STATS_RANGE = '''
+    SELECT
+        date,
+        total_outages,
+        COALESCE(total_offline_seconds, 0),
+        CASE WHEN total_outages > 0
+             THEN COALESCE(total_offline_seconds, 0) / total_outages
+             ELSE 0 END
+    FROM power_stats
+    WHERE date >= ?
+    ORDER BY date DESC
+'''
+
+_SQL_LONGEST_OUTAGE = f'''
+    SELECT {_EVENT_PROJECTION} FROM power_events
+    WHERE event_type = {_OFFLINE} AND timestamp > ?
+    ORDER BY duration_seconds DESC
+    LIMIT 1
+'''
+
+_SQL_OUTAGE_COUNT_TODAY = f'''
+    SELECT COUNT(*) FROM power_events
+    WHERE event_type = {_OFFLINE} AND timestamp >= ?
+'''
+
+_SQL_GET_USER_SETTINGS = 'SELECT * FROM user_settings WHERE user_id = ?'
+
+# Fixed UPDATE templates for the single-field setters: dynamic
+# f-string SQL produces a unique string per call and defeats the
+# statement cache; a fixed template per column also whitelists which
+# columns can ever be touched this way
+_SETTING_UPDATES = {
+    field: (f'UPDATE user_settings SET {field} = ?, '
+            'updated_at = CURRENT_TIMESTAMP WHERE user_id = ? RETURNING *')
+    for field in (
+        'reminders_enabled', 'reminder_schedule_today',
+        'reminder_schedule_tomorrow', 'notifications_enabled',
+        'notification_chats', 'power_monitor_enabled',
+    )
+}
+
+# Mutate the notification_chats JSON array inside SQLite so an
+# add/remove is one UPDATE instead of SELECT + Python edit + UPDATE
+_SQL_ADD_NOTIFICATION_CHAT = '''
+    UPDATE user_settings
+    SET notification_chats = json_insert(notification_chats, '$[#]', ?),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE user_id = ?
+      AND NOT EXISTS (
+          SELECT 1 FROM json_each(notification_chats) WHERE value = ?
+      )
+'''
+
+_SQL_REMOVE_NOTIFICATION_CHAT = '''
+    UPDATE user_settings
+    SET notification_chats = (
+            SELECT COALESCE(json_group_array(value), '[]')
+            FROM json_each(notification_chats)
+            WHERE value != ?
+        ),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE user_id = ?
+      AND EXISTS (
+          SELECT 1 FROM json_each(notification_chats) WHERE value = ?
+      )
+'''
+
+_SQL_DASHBOARD = f'''
+    WITH today AS (
+        SELECT COUNT(*) AS c, COALESCE(SUM(duration_seconds), 0) AS s
+        FROM power_events
+        WHERE event_type = {_OFFLINE} AND timestamp >= ?
+    ),
+    recent AS (
+        SELECT duration_seconds FROM power_events
+        WHERE event_type = {_OFFLINE}
+        ORDER BY timestamp DESC
+        LIMIT 1
+    ),
+    longest AS (
+        SELECT id, duration_seconds, timestamp FROM power_events
+        WHERE event_type = {_OFFLINE} AND timestamp > ?
+        ORDER BY duration_seconds DESC
+        LIMIT 1
+    )
+    SELECT
+        (SELECT c FROM today),
+        (SELECT s FROM today),
+        (SELECT duration_seconds FROM recent),
+        (SELECT id FROM longest),
+        (SELECT duration_seconds FROM longest),
+        (SELECT timestamp FROM longest)
+'''
 
 
 class PowerMonitorDB:
     """SQLite database for power monitoring events."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # How long cached stats responses stay valid; past days are immutable,
+    # only today's bucket can change, and writes clear the cache anyway
+    STATS_CACHE_TTL = 300.0
+
+    def __init__(self, db_path: Optional[Path] = None, background_writes: bool = False):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file. Defaults to project root.
+            background_writes: Queue add_event rows to a writer thread so
+                the caller (e.g. the bot's event loop) never blocks on
+                the journal sync. Off by default: the cron-driven monitor
+                exits right after writing and needs the write durable
+                before it returns.
         """
         if db_path is None:
             db_path = Path(__file__).parent.parent / 'power_monitor.db'
 
-        self.db_path = db_path
+        self.db_path = Path(db_path)
+
+        # One long-lived connection shared by all methods - opening a fresh
+        # connection per call pays file-open and page-cache warmup costs on
+        # every query, which dominates for a cron-driven monitor.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self._write_lock = threading.Lock()
+        # (method, args, date) -> (monotonic deadline, result)
+        self._stats_cache: Dict[Tuple, Tuple[float, object]] = {}
+        # (monotonic read time, size in bytes), dropped by write paths
+        self._size_cache: Optional[Tuple[float, int]] = None
+        self._apply_pragmas()
         self.init_db()
 
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        if background_writes:
+            self._write_queue = queue.Queue()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, daemon=True
+            )
+            self._writer_thread.start()
+
+    def _apply_pragmas(self):
+        """Apply per-connection performance pragmas."""
+        cursor = self._conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        # Wait for a competing writer instead of failing immediately
+        cursor.execute('PRAGMA busy_timeout=5000')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-64000')
+        # Memory-map the DB file so read-heavy queries skip pread syscalls
+        cursor.execute('PRAGMA mmap_size=268435456')
+        # Don't zero freed pages when cleanup deletes old events
+        cursor.execute('PRAGMA secure_delete=OFF')
+
+    def _writer_loop(self):
+        """Drain queued event rows, batching waiting rows per transaction."""
+        while True:
+            row = self._write_queue.get()
+            if row is None:
+                return
+
+            rows = [row]
+            # Pick up anything else already waiting so a burst of events
+            # shares one transaction (and one journal sync)
+            closing = False
+            while True:
+                try:
+                    row = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if row is None:
+                    closing = True
+                    break
+                rows.append(row)
+
+            # A bad batch must not kill the writer thread: with it dead,
+            # every later add_event would enqueue rows nothing drains
+            try:
+                self._flush_rows(rows)
+            except Exception as e:
+                print(f"Error writing {len(rows)} queued event(s): {e}")
+
+            if closing:
+                return
+
+    def _flush_rows(self, rows: List[Tuple]):
+        """Insert queued rows in a single transaction."""
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany(_SQL_INSERT_EVENT, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+            self._stats_cache.clear()
+            self._size_cache = None
+
+    def close(self):
+        """Flush pending writes and close the shared database connection."""
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=10)
+            self._writer_thread = None
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def init_db(self):
         """Create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Power events table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS power_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_type TEXT NOT NULL,
-                    timestamp INTEGER NOT NULL,
-                    event_datetime TEXT NOT NULL,
-                    duration_seconds INTEGER,
-                    message TEXT,
-                    draft_confirmed BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Stats table (for quick queries)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS power_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT NOT NULL UNIQUE,
-                    total_outages INTEGER DEFAULT 0,
-                    total_offline_seconds INTEGER DEFAULT 0,
-                    average_offline_seconds INTEGER,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        cursor = self._conn.cursor()
+
+        # Warm start: schema already at the current version, skip the
+        # CREATE/migration statements (and their sqlite_master lookups)
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] == _SCHEMA_VERSION:
+            return
+
+        # Power events table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS power_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_type INTEGER NOT NULL CHECK(event_type IN (1, 2, 3)),
+                timestamp INTEGER NOT NULL,
+                event_datetime TEXT GENERATED ALWAYS AS
+                    (datetime(timestamp, 'unixepoch')) VIRTUAL,
+                duration_seconds INTEGER,
+                message TEXT,
+                draft_confirmed BOOLEAN DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Stats table (for quick queries)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS power_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL UNIQUE,
+                total_outages INTEGER DEFAULT 0,
+                total_offline_seconds INTEGER DEFAULT 0,
+                average_offline_seconds INTEGER,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # User settings table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_settings (
+                user_id INTEGER PRIMARY KEY,
+                reminders_enabled BOOLEAN DEFAULT 0,
+                reminder_schedule_today TEXT DEFAULT '09:00',
+                reminder_schedule_tomorrow TEXT DEFAULT '09:00',
+                notifications_enabled BOOLEAN DEFAULT 1,
+                notification_chats TEXT DEFAULT '[]',
+                power_monitor_enabled BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Create index for faster queries
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_power_events_timestamp
+            ON power_events(timestamp DESC)
+        ''')
+
+        # Migrate legacy databases that still store event_type as TEXT
+        # (must run before the partial indexes reference integer codes)
+        self._migrate_event_type(cursor)
+        self._migrate_event_datetime(cursor)
+
+        # Maintain the daily aggregates inside SQLite: one trigger firing
+        # per offline insert replaces the extra upsert statement Python
+        # used to issue, and keeps stats correct for any insert path
+        # (add_event, add_events, bulk_import). Created after the
+        # migrations: a trigger referencing event_type would block the
+        # legacy DROP COLUMN above
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_power_stats_upsert
+            AFTER INSERT ON power_events
+            WHEN NEW.event_type = {_OFFLINE}
+            BEGIN
+                INSERT INTO power_stats
+                    (date, total_outages, total_offline_seconds, average_offline_seconds)
+                VALUES (
+                    DATE(NEW.timestamp, 'unixepoch', 'localtime'),
+                    1,
+                    COALESCE(NEW.duration_seconds, 0),
+                    COALESCE(NEW.duration_seconds, 0)
                 )
-            ''')
-
-            # User settings table
+                ON CONFLICT(date) DO UPDATE SET
+                    total_outages = total_outages + 1,
+                    total_offline_seconds =
+                        total_offline_seconds + COALESCE(NEW.duration_seconds, 0),
+                    average_offline_seconds =
+                        (total_offline_seconds + COALESCE(NEW.duration_seconds, 0))
+                            / (total_outages + 1),
+                    updated_at = CURRENT_TIMESTAMP;
+            END
+        ''')
+
+        # Longest-outage lookup: ORDER BY duration DESC LIMIT 1 becomes a
+        # single descent into this small offline-only B-tree
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_power_events_offline_duration
+            ON power_events(duration_seconds DESC) WHERE event_type = {_OFFLINE}
+        ''')
+
+        # Composite equality-then-range index so get_events(event_type=...)
+        # becomes a single index range scan; duration_seconds rides along
+        # so get_recent_offline_duration is answered from the index alone
+        # with no table heap fetch (covering index, schema v6 shape)
+        cursor.execute('DROP INDEX IF EXISTS idx_power_events_type_ts')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_power_events_type_ts
+            ON power_events(event_type, timestamp DESC, duration_seconds)
+        ''')
+
+        # Superseded by the covering composite above
+        cursor.execute('DROP INDEX IF EXISTS idx_power_events_offline_ts')
+
+        # Dominated by the composite and partial indexes above
+        cursor.execute('DROP INDEX IF EXISTS idx_power_events_event_type')
+
+        cursor.execute('ANALYZE')
+
+        cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+
+        self._conn.commit()
+
+        # Incremental auto-vacuum lets cleanup_old_events hand freed pages
+        # back to the OS without a full VACUUM; switching the mode on an
+        # existing file requires one VACUUM to rebuild it
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] != 2:
+            cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            cursor.execute('VACUUM')
+
+        # Backfill aggregates for databases created before power_stats
+        # was maintained incrementally
+        cursor.execute('SELECT NOT EXISTS (SELECT 1 FROM power_stats) AND EXISTS '
+                       f'(SELECT 1 FROM power_events WHERE event_type = {_OFFLINE})')
+        if cursor.fetchone()[0]:
+            self.rebuild_stats()
+
+    def _migrate_event_type(self, cursor):
+        """Convert a legacy TEXT event_type column to integer codes."""
+        cursor.execute('PRAGMA table_info(power_events)')
+        column_types = {row[1]: row[2] for row in cursor.fetchall()}
+        if column_types.get('event_type', '').upper() != 'TEXT':
+            return
+
+        cursor.execute('BEGIN')
+        try:
+            # Indexes referencing the column must go before DROP COLUMN;
+            # init_db recreates them with the integer predicate
+            cursor.execute('DROP INDEX IF EXISTS idx_power_events_event_type')
+            cursor.execute('DROP INDEX IF EXISTS idx_power_events_type_ts')
+            cursor.execute('DROP INDEX IF EXISTS idx_power_events_offline_ts')
+            cursor.execute('DROP INDEX IF EXISTS idx_power_events_offline_duration')
+            cursor.execute('ALTER TABLE power_events ADD COLUMN event_type_int INTEGER')
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_settings (
-                    user_id INTEGER PRIMARY KEY,
-                    reminders_enabled BOOLEAN DEFAULT 0,
-                    reminder_schedule_today TEXT DEFAULT '09:00',
-                    reminder_schedule_tomorrow TEXT DEFAULT '09:00',
-                    notifications_enabled BOOLEAN DEFAULT 1,
-                    notification_chats TEXT DEFAULT '[]',
-                    power_monitor_enabled BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+                UPDATE power_events SET event_type_int = CASE event_type
+                    WHEN 'online' THEN 1
+                    WHEN 'offline' THEN 2
+                    ELSE 3
+                END
             ''')
-
-            # Create index for faster queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_power_events_timestamp
-                ON power_events(timestamp DESC)
-            ''')
-
+            cursor.execute('ALTER TABLE power_events DROP COLUMN event_type')
+            cursor.execute('ALTER TABLE power_events RENAME COLUMN event_type_int TO event_type')
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+
+    def _migrate_event_datetime(self, cursor):
+        """Replace a legacy stored event_datetime column with a virtual one.
+
+        event_datetime is pure derived data (ISO text of timestamp), so a
+        VIRTUAL generated column costs nothing at insert and is computed
+        only when actually SELECT'd.
+        """
+        cursor.execute('PRAGMA table_xinfo(power_events)')
+        # hidden flag (last column): 0 = ordinary stored column,
+        # 2 = VIRTUAL generated
+        hidden = {row[1]: row[-1] for row in cursor.fetchall()}
+        if hidden.get('event_datetime', 2) != 0:
+            return
+
+        cursor.execute('BEGIN')
+        try:
+            cursor.execute('ALTER TABLE power_events DROP COLUMN event_datetime')
+            # 'localtime' is non-deterministic and not allowed in generated
+            # columns, so the derived text is UTC
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_power_events_event_type
-                ON power_events(event_type)
+                ALTER TABLE power_events ADD COLUMN event_datetime TEXT
+                GENERATED ALWAYS AS (datetime(timestamp, 'unixepoch')) VIRTUAL
             ''')
-
-            conn.commit()
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
 
     def add_event(
         self,
@@ -87,8 +536,9 @@ class PowerMonitorDB:
         timestamp: int,
         duration_seconds: Optional[int] = None,
         message: str = "",
-        draft_confirmed: bool = False
-    ) -> int:
+        draft_confirmed: bool = False,
+        return_id: bool = False
+    ) -> Optional[int]:
         """
         Add power event to database.
 
@@ -98,28 +548,181 @@ class PowerMonitorDB:
             duration_seconds: How long device was offline (for offline events)
             message: Event message
             draft_confirmed: Whether draft was confirmed
+            return_id: Fetch and return the inserted row ID
 
         Returns:
-            Event ID
+            Event ID if return_id is True, otherwise None
         """
-        event_datetime = datetime.fromtimestamp(timestamp).isoformat()
+        full_row = (
+            _event_code(event_type), timestamp,
+            duration_seconds, message, draft_confirmed
+        )
+        # Background mode: hand the row to the writer thread so the event
+        # loop doesn't block on the journal sync (return_id still needs
+        # the synchronous path to have an id to return)
+        if self._write_queue is not None and not return_id:
+            self._write_queue.put(full_row)
+            return None
+
+        # The connection is in autocommit mode and the stats trigger runs
+        # inside the INSERT's own statement transaction, so a single-row
+        # add needs no explicit BEGIN/COMMIT
+        with self._write_lock:
+            if return_id:
+                cursor = self._conn.execute(_SQL_INSERT_EVENT + ' RETURNING id', full_row)
+                event_id = cursor.fetchone()[0]
+            else:
+                self._conn.execute(_SQL_INSERT_EVENT, full_row)
+                event_id = None
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO power_events
-                (event_type, timestamp, event_datetime, duration_seconds, message, draft_confirmed)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (event_type, timestamp, event_datetime, duration_seconds, message, draft_confirmed))
+            self._stats_cache.clear()
+            self._size_cache = None
+            return event_id
 
-            conn.commit()
-            return cursor.lastrowid
+    def add_events(self, rows: List[Tuple]) -> List[int]:
+        """
+        Add multiple power events in a single transaction.
+
+        One commit per event means one journal fsync per event; batching
+        amortizes that cost across the whole list.
+
+        Args:
+            rows: List of (event_type, timestamp, duration_seconds,
+                  message, draft_confirmed) tuples
+
+        Returns:
+            List of inserted event IDs (in input order)
+        """
+        if not rows:
+            return []
+
+        full_rows = [
+            (_event_code(event_type), timestamp,
+             duration_seconds, message, draft_confirmed)
+            for event_type, timestamp, duration_seconds, message, draft_confirmed in rows
+        ]
+
+        placeholders = ', '.join(['(?, ?, ?, ?, ?)'] * len(full_rows))
+        params = [value for row in full_rows for value in row]
+
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                cursor.execute(f'''
+                    INSERT INTO power_events
+                    (event_type, timestamp, duration_seconds, message, draft_confirmed)
+                    VALUES {placeholders}
+                    RETURNING id
+                ''', params)
+                event_ids = [row[0] for row in cursor.fetchall()]
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+            self._stats_cache.clear()
+            self._size_cache = None
+            return event_ids
+
+    def bulk_import(self, events_iter, chunk: int = 1000) -> int:
+        """
+        Import historical events from an iterable (e.g. log replay).
+
+        Calling add_event in a loop pays one transaction and one journal
+        sync per row; this streams the source in chunk-sized transactions
+        through executemany without materializing the full list.
+
+        Args:
+            events_iter: Iterable of (event_type, timestamp,
+                         duration_seconds, message, draft_confirmed) tuples
+            chunk: Rows per transaction
+
+        Returns:
+            Number of imported rows
+        """
+        rows_iter = (
+            (_event_code(event_type), timestamp,
+             duration_seconds, message, draft_confirmed)
+            for event_type, timestamp, duration_seconds, message, draft_confirmed
+            in events_iter
+        )
+
+        imported = 0
+        while True:
+            chunk_rows = list(itertools.islice(rows_iter, chunk))
+            if not chunk_rows:
+                break
+
+            with self._write_lock:
+                cursor = self._conn.cursor()
+                cursor.execute('BEGIN')
+                try:
+                    cursor.executemany(_SQL_INSERT_EVENT, chunk_rows)
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+
+            imported += len(chunk_rows)
+
+        # The stats trigger fires per imported row, so the aggregates are
+        # already current; just drop cached responses
+        if imported:
+            self._stats_cache.clear()
+            self._size_cache = None
+
+        return imported
+
+    def rebuild_stats(self):
+        """
+        Recompute power_stats from power_events.
+
+        Used to backfill aggregates for databases created before
+        power_stats was maintained incrementally.
+        """
+        # Bucket by integer day instead of DATE(datetime(...)): one
+        # division per row rather than two datetime conversions plus a
+        # string allocation. The local-time offset shifts bucket
+        # boundaries to local midnight.
+        tz_offset = time.localtime().tm_gmtoff
+
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                cursor.execute('DELETE FROM power_stats')
+                cursor.execute(f'''
+                    INSERT INTO power_stats (date, total_outages, total_offline_seconds, average_offline_seconds)
+                    SELECT
+                        DATE(day_bucket * 86400, 'unixepoch') as date,
+                        outages,
+                        total,
+                        total / outages as average
+                    FROM (
+                        SELECT
+                            (timestamp + ?) / 86400 as day_bucket,
+                            COUNT(*) as outages,
+                            SUM(COALESCE(duration_seconds, 0)) as total
+                        FROM power_events
+                        WHERE event_type = {_OFFLINE}
+                        GROUP BY day_bucket
+                    )
+                ''', (tz_offset,))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        self._stats_cache.clear()
+        self._size_cache = None
 
     def get_events(
         self,
         event_type: Optional[str] = None,
         days: int = 7,
-        limit: int = 50
+        limit: int = 50,
+        include_message: bool = False
     ) -> List[Dict]:
         """
         Get power events.
@@ -128,32 +731,31 @@ class PowerMonitorDB:
             event_type: Filter by event type ('online', 'offline', etc.)
             days: Look back N days
             limit: Maximum events to return
+            include_message: Also fetch the message text column
 
         Returns:
             List of event dictionaries
         """
-        cutoff_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+        cutoff_timestamp = int(time.time()) - days * 86400
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
-            if event_type:
-                cursor.execute('''
-                    SELECT * FROM power_events
-                    WHERE timestamp > ? AND event_type = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (cutoff_timestamp, event_type, limit))
-            else:
-                cursor.execute('''
-                    SELECT * FROM power_events
-                    WHERE timestamp > ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (cutoff_timestamp, limit))
+        if include_message:
+            columns = _EVENT_COLUMNS_WITH_MESSAGE
+            sql_typed, sql_all = _SQL_GET_EVENTS_TYPED_FULL, _SQL_GET_EVENTS_FULL
+        else:
+            columns = _EVENT_COLUMNS
+            sql_typed, sql_all = _SQL_GET_EVENTS_TYPED, _SQL_GET_EVENTS
 
-            return [dict(row) for row in cursor.fetchall()]
+        if event_type:
+            cursor.execute(sql_typed, (cutoff_timestamp, _event_code(event_type), limit))
+        else:
+            cursor.execute(sql_all, (cutoff_timestamp, limit))
+
+        events = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for event in events:
+            event['event_type'] = _EVENT_TYPE_NAMES.get(event['event_type'], event['event_type'])
+        return events
 
     def get_recent_offline_duration(self) -> Optional[int]:
         """
@@ -162,17 +764,23 @@ class PowerMonitorDB:
         Returns:
             Duration in seconds or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT duration_seconds FROM power_events
-                WHERE event_type = 'offline'
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ''')
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_RECENT_OFFLINE)
 
-            result = cursor.fetchone()
-            return result[0] if result else None
+        result = cursor.fetchone()
+        return result[0] if result else None
+
+    def _cached_stats(self, key: Tuple):
+        """Return a cached stats response, or None if absent/expired."""
+        cached = self._stats_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def _store_stats(self, key: Tuple, result):
+        """Cache a stats response for STATS_CACHE_TTL seconds."""
+        self._stats_cache[key] = (time.monotonic() + self.STATS_CACHE_TTL, result)
+        return result
 
     def get_stats_today(self) -> Dict:
         """
@@ -182,28 +790,25 @@ class PowerMonitorDB:
             Dict with outages count and total offline time
         """
         today = datetime.now().date().isoformat()
-        today_start = int(datetime.combine(datetime.now().date(), datetime.min.time()).timestamp())
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cache_key = ('today', today)
+        cached = self._cached_stats(cache_key)
+        if cached is not None:
+            return cached
 
-            # Get offline events today
-            cursor.execute('''
-                SELECT COUNT(*) as count, SUM(duration_seconds) as total
-                FROM power_events
-                WHERE event_type = 'offline' AND timestamp >= ?
-            ''', (today_start,))
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_STATS_TODAY, (today,))
 
-            result = cursor.fetchone()
-            outages_count = result[0] if result[0] else 0
-            total_offline = result[1] if result[1] else 0
+        result = cursor.fetchone()
+        outages_count = result[0] if result else 0
+        total_offline = result[1] if result else 0
 
-            return {
-                'date': today,
-                'outages': outages_count,
-                'total_offline_seconds': total_offline,
-                'average_offline_seconds': total_offline // outages_count if outages_count > 0 else 0
-            }
+        return self._store_stats(cache_key, {
+            'date': today,
+            'outages': outages_count,
+            'total_offline_seconds': total_offline,
+            'average_offline_seconds': total_offline // outages_count if outages_count > 0 else 0
+        })
 
     def get_stats_range(self, days: int = 30) -> List[Dict]:
         """
@@ -217,34 +822,18 @@ class PowerMonitorDB:
         """
         cutoff_date = (datetime.now() - timedelta(days=days)).date()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        cache_key = ('range', days, datetime.now().date().isoformat())
+        cached = self._cached_stats(cache_key)
+        if cached is not None:
+            return cached
 
-            cursor.execute('''
-                SELECT 
-                    DATE(datetime(timestamp, 'unixepoch')) as date,
-                    COUNT(CASE WHEN event_type = 'offline' THEN 1 END) as outages,
-                    SUM(CASE WHEN event_type = 'offline' THEN duration_seconds ELSE 0 END) as total_offline_seconds
-                FROM power_events
-                WHERE DATE(datetime(timestamp, 'unixepoch')) >= ?
-                GROUP BY DATE(datetime(timestamp, 'unixepoch'))
-                ORDER BY date DESC
-            ''', (str(cutoff_date),))
-
-            stats = []
-            for row in cursor.fetchall():
-                total_offline = row['total_offline_seconds'] or 0
-                outages = row['outages']
-
-                stats.append({
-                    'date': row['date'],
-                    'outages': outages,
-                    'total_offline_seconds': total_offline,
-                    'average_offline_seconds': total_offline // outages if outages > 0 else 0
-                })
-
-            return stats
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_STATS_RANGE, (cutoff_date.isoformat(),))
+
+        return self._store_stats(
+            cache_key,
+            [dict(zip(_STATS_RANGE_KEYS, row)) for row in cursor.fetchall()]
+        )
 
     def get_longest_outage(self, days: int = 7) -> Optional[Dict]:
         """
@@ -256,35 +845,71 @@ class PowerMonitorDB:
         Returns:
             Event dict or None
         """
-        cutoff_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+        cutoff_timestamp = int(time.time()) - days * 86400
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_LONGEST_OUTAGE, (cutoff_timestamp,))
 
-            cursor.execute('''
-                SELECT * FROM power_events
-                WHERE event_type = 'offline' AND timestamp > ?
-                ORDER BY duration_seconds DESC
-                LIMIT 1
-            ''', (cutoff_timestamp,))
+        result = cursor.fetchone()
+        if not result:
+            return None
 
-            result = cursor.fetchone()
-            return dict(result) if result else None
+        event = dict(zip(_EVENT_COLUMNS, result))
+        event['event_type'] = _EVENT_TYPE_NAMES.get(event['event_type'], event['event_type'])
+        return event
+
+    @staticmethod
+    def _today_start_ts() -> int:
+        """
+        Unix timestamp of local midnight.
+
+        Integer arithmetic on time.time() instead of building datetime
+        objects via datetime.combine on every call.
+        """
+        now_ts = int(time.time())
+        tz_offset = time.localtime().tm_gmtoff
+        return now_ts - ((now_ts + tz_offset) % 86400)
+
+    def get_dashboard(self, days: int = 7) -> Dict:
+        """
+        Get the combined status-report metrics in one query.
+
+        Replaces the get_stats_today + get_recent_offline_duration +
+        get_longest_outage round-trips with a single statement, so one
+        monitoring tick costs one planner invocation instead of four.
+
+        Args:
+            days: Look back N days for the longest outage
+
+        Returns:
+            Dict with today's counts plus recent and longest outage info
+        """
+        today_start = self._today_start_ts()
+        cutoff_timestamp = int(time.time()) - days * 86400
+
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_DASHBOARD, (today_start, cutoff_timestamp))
+        (outages_today, offline_today, recent_duration,
+         longest_id, longest_duration, longest_timestamp) = cursor.fetchone()
+
+        return {
+            'outages_today': outages_today,
+            'total_offline_seconds_today': offline_today,
+            'recent_offline_duration': recent_duration,
+            'longest_outage_id': longest_id,
+            'longest_outage_duration': longest_duration,
+            'longest_outage_timestamp': longest_timestamp,
+        }
 
     def get_outage_count_today(self) -> int:
         """Get number of outages today."""
-        today_start = int(datetime.combine(datetime.now().date(), datetime.min.time()).timestamp())
+        today_start = self._today_start_ts()
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT COUNT(*) FROM power_events
-                WHERE event_type = 'offline' AND timestamp >= ?
-            ''', (today_start,))
+        cursor = self._conn.cursor()
+        cursor.execute(_SQL_OUTAGE_COUNT_TODAY, (today_start,))
 
-            result = cursor.fetchone()
-            return result[0] if result[0] else 0
+        result = cursor.fetchone()
+        return result[0] if result[0] else 0
 
     def cleanup_old_events(self, days: int = 90) -> int:
         """
@@ -296,64 +921,113 @@ class PowerMonitorDB:
         Returns:
             Number of deleted rows
         """
-        cutoff_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM power_events WHERE timestamp < ?', (cutoff_timestamp,))
-            conn.commit()
-
-            return cursor.rowcount
+        cutoff_timestamp = int(time.time()) - days * 86400
+
+        # Delete in chunks so each write transaction stays short: a single
+        # big DELETE holds the write lock for the whole scan and stalls
+        # the monitor's own inserts
+        deleted_total = 0
+        cursor = self._conn.cursor()
+        while True:
+            with self._write_lock:
+                cursor.execute('''
+                    DELETE FROM power_events WHERE rowid IN (
+                        SELECT rowid FROM power_events WHERE timestamp < ? LIMIT 1000
+                    )
+                ''', (cutoff_timestamp,))
+                self._conn.commit()
+
+            if cursor.rowcount <= 0:
+                break
+            deleted_total += cursor.rowcount
+
+        if deleted_total:
+            # Return the freed pages to the OS and trim the WAL file.
+            # Python's sqlite3 only steps the pragma once per execute
+            # (one page), so loop until the freelist is drained.
+            while cursor.execute('PRAGMA freelist_count').fetchone()[0]:
+                cursor.execute('PRAGMA incremental_vacuum')
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self._stats_cache.clear()
+            self._size_cache = None
+
+        return deleted_total
 
     def get_db_size(self) -> int:
-        """Get database file size in bytes."""
-        if self.db_path.exists():
-            return self.db_path.stat().st_size
-        return 0
+        """Get database file size in bytes (cached for a few seconds)."""
+        if (self._size_cache is not None
+                and time.monotonic() - self._size_cache[0] < 5.0):
+            return self._size_cache[1]
+
+        size = self.db_path.stat().st_size if self.db_path.exists() else 0
+        self._size_cache = (time.monotonic(), size)
+        return size
 
     # ==================== USER SETTINGS ====================
 
     def get_user_settings(self, user_id: int) -> Dict:
         """Get settings for user."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cursor.row_factory = sqlite3.Row
 
-            cursor.execute('SELECT * FROM user_settings WHERE user_id = ?', (user_id,))
-            result = cursor.fetchone()
+        cursor.execute(_SQL_GET_USER_SETTINGS, (user_id,))
+        result = cursor.fetchone()
 
-            if result:
-                import json
-                settings = dict(result)
-                # Parse JSON field
-                settings['notification_chats'] = json.loads(settings['notification_chats'])
-                return settings
-            else:
-                # Create default settings
-                return self.create_user_settings(user_id)
+        if result:
+            return self._parse_settings_row(result)
+        else:
+            # Create default settings
+            return self.create_user_settings(user_id)
+
+    @staticmethod
+    def _parse_settings_row(row) -> Dict:
+        """Turn a user_settings row into a dict with parsed JSON fields."""
+        settings = dict(row)
+        settings['notification_chats'] = json.loads(settings['notification_chats'])
+        return settings
 
     def create_user_settings(self, user_id: int) -> Dict:
         """Create default settings for new user."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
+            # RETURNING hands back the fresh row in the same statement,
+            # saving the insert-then-reselect round-trip
             cursor.execute('''
-                INSERT OR IGNORE INTO user_settings
-                (user_id, reminders_enabled, reminder_schedule_today, 
+                INSERT INTO user_settings
+                (user_id, reminders_enabled, reminder_schedule_today,
                  reminder_schedule_tomorrow, notifications_enabled, power_monitor_enabled)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id) DO NOTHING
+                RETURNING *
             ''', (user_id, False, '09:00', '09:00', True, True))
 
-            conn.commit()
+            result = cursor.fetchone()
+            self._conn.commit()
+
+        if result is None:
+            # Row already existed - the conflict clause returned nothing
+            return self.get_user_settings(user_id)
 
-        return self.get_user_settings(user_id)
+        return self._parse_settings_row(result)
 
     def update_user_settings(self, user_id: int, **kwargs) -> Dict:
         """Update user settings."""
-        import json
+        if not kwargs:
+            return self.get_user_settings(user_id)
+
+        # Single known field: use the fixed template so the statement
+        # cache hits; the dynamic builder below is the multi-field path
+        if len(kwargs) == 1:
+            (key, value), = kwargs.items()
+            sql = _SETTING_UPDATES.get(key)
+            if sql is not None:
+                return self._set_setting(sql, user_id, key, value)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
 
             # Build dynamic UPDATE query
             fields = []
@@ -365,17 +1039,37 @@ class PowerMonitorDB:
                 fields.append(f"{key} = ?")
                 values.append(value)
 
-            if not fields:
-                return self.get_user_settings(user_id)
-
             fields.append("updated_at = CURRENT_TIMESTAMP")
-            query = f"UPDATE user_settings SET {', '.join(fields)} WHERE user_id = ?"
+            query = (f"UPDATE user_settings SET {', '.join(fields)} "
+                     "WHERE user_id = ? RETURNING *")
             values.append(user_id)
 
             cursor.execute(query, values)
-            conn.commit()
+            result = cursor.fetchone()
+            self._conn.commit()
 
-        return self.get_user_settings(user_id)
+        if result is None:
+            # No such user yet - fall back to default-creation path
+            return self.get_user_settings(user_id)
+
+        return self._parse_settings_row(result)
+
+    def _set_setting(self, sql: str, user_id: int, key: str, value) -> Dict:
+        """Run a fixed single-field settings UPDATE."""
+        if key == 'notification_chats':
+            value = json.dumps(value)
+
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(sql, (value, user_id))
+            result = cursor.fetchone()
+            self._conn.commit()
+
+        if result is None:
+            return self.get_user_settings(user_id)
+
+        return self._parse_settings_row(result)
 
     def set_reminders_enabled(self, user_id: int, enabled: bool):
         """Enable/disable reminders for user."""
@@ -397,20 +1091,28 @@ class PowerMonitorDB:
         """Enable/disable notifications for user."""
         return self.update_user_settings(user_id, notifications_enabled=enabled)
 
+    def _update_notification_chats(self, sql: str, user_id: int, chat_id: int):
+        """Run a JSON-mutating chat update, creating the user row if needed."""
+        for _ in range(2):
+            with self._write_lock:
+                cursor = self._conn.cursor()
+                cursor.execute(sql, (chat_id, user_id, chat_id))
+                self._conn.commit()
+
+            if cursor.rowcount > 0:
+                return
+
+            # Nothing updated: either a no-op (chat already in the wanted
+            # state) or the user row doesn't exist yet - create and retry
+            cursor.execute('SELECT 1 FROM user_settings WHERE user_id = ?', (user_id,))
+            if cursor.fetchone():
+                return
+            self.create_user_settings(user_id)
+
     def add_notification_chat(self, user_id: int, chat_id: int):
         """Add notification chat for user."""
-        settings = self.get_user_settings(user_id)
-        chats = settings['notification_chats']
-
-        if chat_id not in chats:
-            chats.append(chat_id)
-            self.update_user_settings(user_id, notification_chats=chats)
+        self._update_notification_chats(_SQL_ADD_NOTIFICATION_CHAT, user_id, chat_id)
 
     def remove_notification_chat(self, user_id: int, chat_id: int):
         """Remove notification chat for user."""
-        settings = self.get_user_settings(user_id)
-        chats = settings['notification_chats']
-
-        if chat_id in chats:
-            chats.remove(chat_id)
-            self.update_user_settings(user_id, notification_chats=chats)
\ No newline at end of file
+        self._update_notification_chats(_SQL_REMOVE_NOTIFICATION_CHAT, user_id, chat_id)
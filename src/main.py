@@ -3,7 +3,6 @@
 import sys
 import os
 
-# src/__init__.py завантажує .env автоматично
 import src
 from src.telegram_bot import TelegramBot
 
@@ -69,6 +68,8 @@ def demonstrate_telegram_bot():
 
 def main():
     """Main entry point."""
+    src._bootstrap_env()
+
     hello()
     
     # Show mode selection
@@ -3,14 +3,37 @@
 import os
 import json
 import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 import httpx
 
+from . import _bootstrap_env
 from .telegram_bot import TelegramBot
 from .database import PowerMonitorDB
 
+# Ukrainian declensions of 'day': 1 день, 2-4 дні, 5+ днів
+_DAY_WORDS = ('день', 'дні', 'днів')
+
+# orjson parses/serializes a few times faster than stdlib json; fall
+# back silently since it's an optional speedup, not a requirement
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
 
 class PowerMonitor:
     """
@@ -27,10 +50,22 @@ class PowerMonitor:
     # 10 minutes confirmation delay
     POWER_OFF_CONFIRMATION_DELAY = 10 * 60  # seconds
 
+    # Shared HTTP client, created lazily on first use (class-level default
+    # so test doubles that bypass __init__ still work)
+    _http: Optional[httpx.AsyncClient] = None
+
+    # In-memory copy of the .power_status file; this process is the sole
+    # writer, so the cache is authoritative while the mtime matches
+    _status_cache: Optional[Dict[str, Any]] = None
+    _status_cache_mtime: float = 0.0
+    _status_cache_json: Optional[str] = None
+
     def __init__(self):
         """
         Initialize Power Monitor.
         """
+        _bootstrap_env()
+
         self.telegram_bot = TelegramBot()
         self.db = PowerMonitorDB()
         
@@ -42,8 +77,12 @@ class PowerMonitor:
             raise ValueError("ewelink_accessToken and ewelink_deviceId must be set in environment")
         
         # Parse power chat IDs (comma-separated)
+        # Order-preserving dedupe - a chat id repeated in the env var
+        # would otherwise get the same notification twice per event
         power_chat_ids_str = os.getenv('POWER_CHAT_IDS', '')
-        self.power_chat_ids = [cid.strip() for cid in power_chat_ids_str.split(',') if cid.strip()]
+        self.power_chat_ids = list(dict.fromkeys(
+            cid.strip() for cid in power_chat_ids_str.split(',') if cid.strip()
+        ))
         
         # Debug chat ID
         self.debug_chat_id = os.getenv('DEBUG_CHAT_ID')
@@ -56,10 +95,34 @@ class PowerMonitor:
         self.log_monitor = debug_mode or os.getenv('LOG_POWER', 'false').lower() == 'true'
         self.log_track = debug_mode or os.getenv('TRACK_POWER_DRAFT', 'false').lower() == 'true'
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        A fresh AsyncClient per check means a new TCP+TLS handshake to the
+        eWelink API on every tick; the pooled client keeps the connection
+        alive between checks.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=10.0,
+                headers={
+                    'Content-Type': 'application/json',
+                    'Authorization': f'Bearer {self.access_token}'
+                }
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def check_power_status(self) -> Optional[Dict[str, Any]]:
         """
         Check device power status via ewelink API.
-        
+
         Returns:
             dict with keys: online (bool), timestamp (int), rawData (dict)
             None if request fails
@@ -73,20 +136,17 @@ class PowerMonitor:
                     }
                 ]
             }
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://apia.coolkit.cn/v2/device/thing',
-                    json=request_body,
-                    headers={
-                        'Content-Type': 'application/json',
-                        'Authorization': f'Bearer {self.access_token}'
-                    },
-                    timeout=10.0
-                )
-            
-            data = response.json()
-            
+
+            response = await self._get_http().post(
+                'https://apia.coolkit.cn/v2/device/thing',
+                json=request_body
+            )
+
+            response.raise_for_status()
+            # Parse the raw bytes directly instead of response.json(),
+            # skipping httpx's intermediate str decode of the body
+            data = _json_loads(response.content)
+
             if self.log_monitor:
                 self._log_api_call('check_power_status', request_body, data)
             
@@ -96,7 +156,7 @@ class PowerMonitor:
             
             return {
                 'online': is_online,
-                'timestamp': int(datetime.now().timestamp()),
+                'timestamp': int(time.time()),
                 'raw_data': device
             }
             
@@ -113,11 +173,18 @@ class PowerMonitor:
         """
         try:
             if self.status_file.exists():
-                with open(self.status_file, 'r') as f:
-                    return json.load(f)
+                mtime = self.status_file.stat().st_mtime
+                if self._status_cache is not None and mtime == self._status_cache_mtime:
+                    return self._status_cache
+
+                status = _json_loads(self.status_file.read_bytes())
+
+                self._status_cache = status
+                self._status_cache_mtime = mtime
+                return status
         except Exception as error:
             print(f"❌ Failed to load last status: {str(error)}")
-        
+
         return None
 
     def save_status(self, status: Dict[str, Any]):
@@ -128,8 +195,19 @@ class PowerMonitor:
             status: Status dictionary to save
         """
         try:
+            payload = _json_dumps(status)
+
+            # Identical payload - nothing to rewrite
+            if payload == self._status_cache_json and self.status_file.exists():
+                self._status_cache = status
+                return
+
             with open(self.status_file, 'w') as f:
-                json.dump(status, f, indent=2)
+                f.write(payload)
+
+            self._status_cache = status
+            self._status_cache_json = payload
+            self._status_cache_mtime = self.status_file.stat().st_mtime
         except Exception as error:
             print(f"❌ Failed to save status: {str(error)}")
 
@@ -151,31 +229,42 @@ class PowerMonitor:
         Returns:
             Formatted string (e.g., "2 дні 3 год. 45 хв")
         """
-        total_minutes = seconds // 60
-        total_hours = total_minutes // 60
-        days = total_hours // 24
-        hours = total_hours % 24
-        minutes = total_minutes % 60
-        
+        total_hours, minutes = divmod(seconds // 60, 60)
+        days, hours = divmod(total_hours, 24)
+
         parts = []
-        
+
         if days > 0:
-            if days == 1:
-                day_word = 'день'
-            elif 2 <= days <= 4:
-                day_word = 'дні'
-            else:
-                day_word = 'днів'
+            day_word = _DAY_WORDS[0 if days == 1 else (1 if 2 <= days <= 4 else 2)]
             parts.append(f"{days} {day_word}")
-        
+
         if hours > 0:
             parts.append(f"{hours} год.")
-        
+
         if minutes > 0 or (days == 0 and hours == 0):
             parts.append(f"{minutes} хв")
-        
+
         return ' '.join(parts)
 
+    async def _broadcast(self, text: str):
+        """
+        Send the same message to every power chat concurrently.
+
+        Sequential awaits grow linearly with the chat count at one
+        Telegram round-trip each; gather collapses that to ~one RTT.
+        Failures are per-chat (return_exceptions) so one bad chat id
+        doesn't abort the rest.
+        """
+        await asyncio.gather(
+            *(self.telegram_bot.send_message(
+                text=text,
+                chat_id=chat_id,
+                silent_mode=False,
+                force_send=True
+            ) for chat_id in self.power_chat_ids),
+            return_exceptions=True
+        )
+
     async def monitor_power_status(self):
         """
         Monitor power status and send notifications on changes.
@@ -193,13 +282,15 @@ class PowerMonitor:
                 print("⚠️  Could not check power status")
             return
         
-        last_status = self.load_last_status()
-        now = datetime.now()
-        time_str = now.strftime("%H:%M")
+        # File IO happens off the event loop so a slow disk can't stall
+        # other tasks sharing it
+        last_status = await asyncio.to_thread(self.load_last_status)
+        time_str = time.strftime("%H:%M")
+        debug_active = bool(self.log_track and self.debug_chat_id)
         
         # First run - just save status
         if not last_status:
-            self.save_status({
+            await asyncio.to_thread(self.save_status, {
                 'online': current_status['online'],
                 'timestamp': current_status['timestamp'],
                 'status_changed_at': current_status['timestamp'],
@@ -209,24 +300,21 @@ class PowerMonitor:
                 print(f"[{time_str}] 📍 Initial power status: {'🟢 Online' if current_status['online'] else '🔴 Offline'}")
             return
         
-        # Both online - no change
+        # Both online / both offline - no change. Skip the file rewrite,
+        # except to clear a stale draft_off_time: a flicker lands here
+        # while a draft is pending, and leaving the draft behind would
+        # make the next real outage confirm instantly.
         if last_status.get('online') and current_status['online']:
-            self.save_status({
-                'online': current_status['online'],
-                'timestamp': current_status['timestamp'],
-                'status_changed_at': last_status.get('status_changed_at'),
-                'raw_data': current_status['raw_data']
-            })
+            if last_status.get('draft_off_time'):
+                await asyncio.to_thread(self.save_status, {
+                    'online': True,
+                    'timestamp': current_status['timestamp'],
+                    'status_changed_at': last_status.get('status_changed_at'),
+                    'raw_data': current_status['raw_data']
+                })
             return
-        
-        # Both offline - no change
+
         if not last_status.get('online') and not current_status['online']:
-            self.save_status({
-                'online': current_status['online'],
-                'timestamp': current_status['timestamp'],
-                'status_changed_at': last_status.get('status_changed_at'),
-                'raw_data': current_status['raw_data']
-            })
             return
         
         # Offline → Online: Send notification immediately
@@ -243,16 +331,10 @@ class PowerMonitor:
                 message=message
             )
             
-            for chat_id in self.power_chat_ids:
-                await self.telegram_bot.send_message(
-                    text=message,
-                    chat_id=chat_id,
-                    silent_mode=False,
-                    force_send=True
-                )
-            
+            await self._broadcast(message)
+
             # Debug notification if in draft mode
-            if last_status.get('draft_off_time') and self.log_track and self.debug_chat_id:
+            if debug_active and last_status.get('draft_off_time'):
                 draft_duration = current_status['timestamp'] - last_status.get('draft_off_time')
                 draft_duration_str = self.format_duration(draft_duration)
                 debug_message = (
@@ -266,7 +348,7 @@ class PowerMonitor:
                     force_send=True
                 )
             
-            self.save_status({
+            await asyncio.to_thread(self.save_status, {
                 'online': current_status['online'],
                 'timestamp': current_status['timestamp'],
                 'status_changed_at': current_status['timestamp'],
@@ -278,7 +360,7 @@ class PowerMonitor:
         if last_status.get('online') and not current_status['online']:
             # First time power off - start draft
             if not last_status.get('draft_off_time'):
-                self.save_status({
+                await asyncio.to_thread(self.save_status, {
                     'online': True,  # Still consider online
                     'timestamp': current_status['timestamp'],
                     'status_changed_at': last_status.get('status_changed_at'),
@@ -287,7 +369,7 @@ class PowerMonitor:
                 })
                 
                 # Debug notification
-                if self.log_track and self.debug_chat_id:
+                if debug_active:
                     draft_message = (
                         f"⚠️ <b>DRAFT: Потенційне вимкнення світла</b>\n\n"
                         f"🕐 Час виявлення: {time_str}\n"
@@ -323,16 +405,10 @@ class PowerMonitor:
                     draft_confirmed=True
                 )
                 
-                for chat_id in self.power_chat_ids:
-                    await self.telegram_bot.send_message(
-                        text=message,
-                        chat_id=chat_id,
-                        silent_mode=False,
-                        force_send=True
-                    )
-                
+                await self._broadcast(message)
+
                 # Debug notification
-                if self.log_track and self.debug_chat_id:
+                if debug_active:
                     debug_message = (
                         f"✅ <b>DRAFT ПІДТВЕРДЖЕНО</b>\n\n"
                         f"🔦 Вимкнення світла підтверджено після 10 хвилин"
@@ -344,7 +420,7 @@ class PowerMonitor:
                         force_send=True
                     )
                 
-                self.save_status({
+                await asyncio.to_thread(self.save_status, {
                     'online': False,
                     'timestamp': current_status['timestamp'],
                     'status_changed_at': current_status['timestamp'],
@@ -363,12 +439,14 @@ class PowerMonitor:
         Example cron entry:
         */1 * * * * cd /path/to/project && python -c "from src.power_monitor import PowerMonitor; PowerMonitor().run()"
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        asyncio.run(self._run_once())
+
+    async def _run_once(self):
+        """One monitoring pass plus HTTP client teardown."""
         try:
-            loop.run_until_complete(self.monitor_power_status())
+            await self.monitor_power_status()
         finally:
-            loop.close()
+            await self.aclose()
 
     async def start_monitoring(self, interval_minutes: int = 1):
         """
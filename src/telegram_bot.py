@@ -1,11 +1,23 @@
 """Telegram Bot Module for sending messages with time-based restrictions."""
 
 import asyncio
-from datetime import datetime
-from typing import Optional
+import functools
+from datetime import datetime, time
+from time import time as _epoch
+from typing import Dict, Optional
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 import os
+import sys
+
+try:
+    from . import _bootstrap_env
+except ImportError:
+    # Imported bare as `telegram_bot` (the tests put src/ itself on
+    # sys.path), where there is no package to load .env files from
+    def _bootstrap_env():
+        pass
 
 
 class TelegramBot:
@@ -19,35 +31,65 @@ class TelegramBot:
     - Configurable parameters from Config manager
     """
 
+    # Restricted window boundaries (23:30 - 00:30), parsed once instead
+    # of strptime'ing the same constants on every send
+    _RESTRICT_START = time(23, 30)
+    _RESTRICT_END = time(0, 30)
+
+    # Interned so comparisons against an equally interned literal hit
+    # CPython's identity fast path before any character compare
+    _RESTRICTION_WINDOW = sys.intern("23:30 - 00:30")
+
+    # Bot objects shared per token: each Bot owns an httpx pool, so
+    # constructing TelegramBot repeatedly (e.g. one per cron tick)
+    # would otherwise pile up redundant connection pools
+    _shared_bots: Dict[str, Bot] = {}
+
     def __init__(self):
         """Initialize Telegram Bot with credentials from environment variables."""
+        _bootstrap_env()
         self.token = os.getenv("TELEGRAM_BOT_TOKEN")
         self.default_chat_id = os.getenv("TELEGRAM_CHAT_ID")
         
         if not self.token:
             raise ValueError("TELEGRAM_BOT_TOKEN not found in environment variables")
         
-        self.bot = Bot(token=self.token)
+        self.bot = self._get_bot(self.token)
+
+    @classmethod
+    def _get_bot(cls, token: str) -> Bot:
+        """Get (or lazily create) the shared Bot for a token."""
+        bot = cls._shared_bots.get(token)
+        if bot is None:
+            bot = Bot(token=token, request=HTTPXRequest(connection_pool_size=8))
+            cls._shared_bots[token] = bot
+        return bot
+
+    @classmethod
+    def _reset_shared_bots(cls):
+        """Drop cached Bot instances (test hook)."""
+        cls._shared_bots.clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _restricted_at(ttl_hash: int) -> bool:
+        """Evaluate the restriction window, memoized per ttl_hash."""
+        current_time = datetime.now().time()
+
+        # Overnight wrap (23:30 to 23:59 and 00:00 to 00:30)
+        return (current_time >= TelegramBot._RESTRICT_START
+                or current_time <= TelegramBot._RESTRICT_END)
 
     def _is_restricted_time(self) -> bool:
         """
         Check if current time is in restricted period (23:30 - 00:30).
-        
+
         Returns:
             bool: True if current time is between 23:30 and 00:30, False otherwise
         """
-        now = datetime.now()
-        current_time = now.time()
-        
-        # Define restricted time window: 23:30 to 00:30
-        start_time = datetime.strptime("23:30", "%H:%M").time()
-        end_time = datetime.strptime("00:30", "%H:%M").time()
-        
-        # Handle overnight wrap (23:30 to 23:59 and 00:00 to 00:30)
-        if start_time <= current_time or current_time <= end_time:
-            return True
-        
-        return False
+        # Keyed to the current second, so bursts of sends within one
+        # second share a single datetime.now() evaluation
+        return self._restricted_at(int(_epoch()))
 
     async def send_message(
         self,
@@ -116,14 +158,9 @@ class TelegramBot:
         Returns:
             bool: True if message sent successfully, False otherwise
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self.send_message(text, chat_id, silent_mode, force_send)
-            )
-        finally:
-            loop.close()
+        return asyncio.run(
+            self.send_message(text, chat_id, silent_mode, force_send)
+        )
 
     def get_restricted_time_info(self) -> dict:
         """
@@ -136,5 +173,5 @@ class TelegramBot:
         return {
             "restricted_time_active": self._is_restricted_time(),
             "current_time": now.strftime("%H:%M:%S"),
-            "restriction_window": "23:30 - 00:30",
+            "restriction_window": self._RESTRICTION_WINDOW,
         }
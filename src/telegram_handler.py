@@ -1,15 +1,15 @@
 """Telegram Bot Handler with inline menu system."""
 
+import asyncio
 import os
-import json
 import logging
-from datetime import datetime
-from pathlib import Path
-from typing import Optional, Dict
+import time
+from typing import Dict
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes, filters
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
 
+from . import _bootstrap_env
 from .database import PowerMonitorDB
 
 # Setup logging
@@ -19,10 +19,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ukrainian declensions of 'day': 1 день, 2-4 дні, 5+ днів
+_DAY_WORDS = ('день', 'дні', 'днів')
+
+# event_type -> (emoji, status label) for the status screen
+_STATUS_MAP = {
+    'online': ('🟢', 'СВІТЛО ВКЛ'),
+    'offline': ('🔴', 'СВІТЛО ВИМ'),
+}
+
+# Static reply texts - built once instead of re-concatenated per call
+_TXT_SETTINGS = "⚙️ <b>Налаштування</b>"
+_TXT_SCHEDULE_TODAY = (
+    "📊 <b>Графік на сьогодні</b>\n\n"
+    "⚠️ Графік будуть додатися пізніше"
+)
+_TXT_SCHEDULE_TOMORROW = (
+    "📊 <b>Графік на завтра</b>\n\n"
+    "⚠️ Графік будуть додатися пізніше"
+)
+_TXT_UPDATE_TOKEN = (
+    "🔑 <b>Оновити токен еелінк</b>\n\n"
+    "⚠️ Функція буде реалізована пізніше"
+)
+_TXT_LOGS = (
+    "📝 <b>Логи</b>\n\n"
+    "⚠️ Функція буде реалізована пізніше"
+)
+
+
+def _build_time_markup(prefix: str, times: tuple, back_cb: str) -> InlineKeyboardMarkup:
+    """Two-per-row time keyboard with short indexed callback codes."""
+    rows = [
+        [InlineKeyboardButton(times[i], callback_data=f"{prefix}{i}")
+         for i in (pair, pair + 1) if i < len(times)]
+        for pair in range(0, len(times), 2)
+    ]
+    rows.append([InlineKeyboardButton("⬅️ Назад", callback_data=back_cb)])
+    return InlineKeyboardMarkup(rows)
+
 
 class BotMenuHandler:
     """Telegram Bot with inline menu system."""
 
+    # Fixed attribute set: skips the per-instance __dict__ and turns
+    # the hot self.* lookups in the router into C-level slot fetches
+    __slots__ = (
+        'token', 'db', 'app', '_routes', '_settings_cache',
+        '_last_event_cache', '_rendered_cache',
+        '_set_today', '_set_tomorrow',
+    )
+
     # Menu callbacks
     CB_MAIN_MENU = "main_menu"
     CB_STATUS = "status"
@@ -37,14 +84,104 @@ class BotMenuHandler:
     CB_REMINDERS_TIME_TOMORROW = "reminders_time_tomorrow"
     CB_BACK = "back"
 
+    # Static keyboards, built once at class definition - none of them
+    # vary per user, so rebuilding the button tree on every callback
+    # was pure allocation churn
+    _MAIN_MENU_MARKUP = InlineKeyboardMarkup([
+        [InlineKeyboardButton("💡 Поточний статус", callback_data=CB_STATUS)],
+        [InlineKeyboardButton("📊 Графік на сьогодні", callback_data=CB_SCHEDULE_TODAY)],
+        [InlineKeyboardButton("📊 Графік на завтра", callback_data=CB_SCHEDULE_TOMORROW)],
+        [InlineKeyboardButton("⚙️ Налаштування", callback_data=CB_SETTINGS)],
+    ])
+    _SETTINGS_MARKUP = InlineKeyboardMarkup([
+        [InlineKeyboardButton("🔔 Оповіщення в чати", callback_data=CB_NOTIFICATIONS)],
+        [InlineKeyboardButton("🔕 Нагадування", callback_data=CB_REMINDERS)],
+        [InlineKeyboardButton("🔑 Оновити токен еелінк", callback_data=CB_UPDATE_TOKEN)],
+        [InlineKeyboardButton("📝 Логи", callback_data=CB_LOGS)],
+        [InlineKeyboardButton("⬅️ Назад", callback_data=CB_MAIN_MENU)],
+    ])
+    _REMINDERS_MARKUP = InlineKeyboardMarkup([
+        [InlineKeyboardButton("📊 Час для сьогодні", callback_data=CB_REMINDERS_TIME_TODAY)],
+        [InlineKeyboardButton("📊 Час для завтра", callback_data=CB_REMINDERS_TIME_TOMORROW)],
+        [InlineKeyboardButton("⬅️ Назад", callback_data=CB_SETTINGS)],
+    ])
+    _BACK_TO_MAIN = InlineKeyboardMarkup(
+        [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_MAIN_MENU)]])
+    _BACK_TO_SETTINGS = InlineKeyboardMarkup(
+        [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_SETTINGS)]])
+    _BACK_TO_REMINDERS = InlineKeyboardMarkup(
+        [[InlineKeyboardButton("⬅️ Назад", callback_data=CB_REMINDERS)]])
+
+    # Reminder time options and their selection keyboards, two buttons
+    # per row - the options are fixed, so both keyboards are static
+    # too. Buttons carry short indexed codes ("tT0".."tM5") instead of
+    # the full "time_today_HH:MM" payload; _TIME_DECODE maps a code
+    # back to its (day kind, time string) in one dict lookup.
+    _TIMES = ("06:00", "09:00", "12:00", "15:00", "18:00", "21:00")
+    _TIME_TODAY_MARKUP = _build_time_markup("tT", _TIMES, CB_REMINDERS)
+    _TIME_TOMORROW_MARKUP = _build_time_markup("tM", _TIMES, CB_REMINDERS)
+    _TIME_DECODE = (
+        {f"tT{i}": ("today", t) for i, t in enumerate(_TIMES)}
+        | {f"tM{i}": ("tomorrow", t) for i, t in enumerate(_TIMES)}
+    )
+
+    # Per-user settings cache lifetime; settings change only through
+    # explicit writes (which invalidate), so a couple of minutes of
+    # staleness tolerance just absorbs repeated button presses
+    SETTINGS_CACHE_TTL = 120.0
+
+    # The last event changes at most about once a minute; a 5s cache
+    # absorbs status-button bursts without visible staleness
+    LAST_EVENT_TTL = 5.0
+
     def __init__(self):
         """Initialize bot."""
+        _bootstrap_env()
+
         self.token = os.getenv('TELEGRAM_BOT_TOKEN')
         if not self.token:
             raise ValueError("TELEGRAM_BOT_TOKEN not set")
 
         self.db = PowerMonitorDB()
-        self.app = Application.builder().token(self.token).build()
+        # Pre-bound setters - the time-button path grabs these on
+        # every press, so bind the methods once instead of creating a
+        # fresh bound method per dispatch
+        self._set_today = self.db.set_reminder_schedule_today
+        self._set_tomorrow = self.db.set_reminder_schedule_tomorrow
+        # user_id -> (monotonic insert time, settings dict)
+        self._settings_cache: Dict[int, tuple] = {}
+        # (monotonic fetch time, last events list)
+        self._last_event_cache = (0.0, None)
+        # (user_id, screen) -> rendered text; entries never outlive
+        # the settings cache entry they were rendered from
+        self._rendered_cache: Dict[tuple, str] = {}
+        # Concurrent update processing plus a pool sized for bursts -
+        # with the defaults every callback serializes behind the
+        # previous user's answer/edit round-trips
+        self.app = (
+            Application.builder()
+            .token(self.token)
+            .concurrent_updates(True)
+            .connection_pool_size(64)
+            .pool_timeout(5.0)
+            .get_updates_connection_pool_size(8)
+            .build()
+        )
+        # Fixed callback_data -> bound handler; one hash lookup per
+        # button press instead of a comparison chain
+        self._routes = {
+            self.CB_MAIN_MENU: self._handle_main_menu,
+            self.CB_STATUS: self.handle_status,
+            self.CB_SCHEDULE_TODAY: self.handle_schedule_today,
+            self.CB_SCHEDULE_TOMORROW: self.handle_schedule_tomorrow,
+            self.CB_SETTINGS: self.handle_settings,
+            self.CB_NOTIFICATIONS: self.handle_notifications,
+            self.CB_REMINDERS: self.handle_reminders,
+            self.CB_UPDATE_TOKEN: self.handle_update_token,
+            self.CB_LOGS: self.handle_logs,
+            self.CB_REMINDERS_TIME_TODAY: self.handle_reminders_time_today,
+            self.CB_REMINDERS_TIME_TOMORROW: self.handle_reminders_time_tomorrow,
+        }
         self.setup_handlers()
 
     def setup_handlers(self):
@@ -53,9 +190,38 @@ class BotMenuHandler:
         self.app.add_handler(CommandHandler("menu", self.cmd_menu))
         self.app.add_handler(CallbackQueryHandler(self.handle_callback))
 
-    def get_user_settings(self, user_id: int) -> Dict:
-        """Get settings for user from database."""
-        return self.db.get_user_settings(user_id)
+    async def _db(self, fn, *args, **kwargs):
+        """Run a synchronous DB call in a worker thread.
+
+        SQLite calls block on disk; routed through a thread they don't
+        stall the event loop serving every other callback.
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def get_user_settings(self, user_id: int) -> Dict:
+        """Get settings for user, served from a short TTL cache."""
+        cached = self._settings_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.SETTINGS_CACHE_TTL:
+            return cached[1]
+
+        settings = await self._db(self.db.get_user_settings, user_id)
+        # Pre-format the chat list once per fetch; renders just read it
+        settings['_notification_chats_str'] = (
+            ', '.join(map(str, settings['notification_chats'])) or 'Не встановлено'
+        )
+        self._settings_cache[user_id] = (time.monotonic(), settings)
+        self._drop_rendered(user_id)
+        return settings
+
+    def _invalidate_user_settings(self, user_id: int):
+        """Drop a user's cached settings after a write."""
+        self._settings_cache.pop(user_id, None)
+        self._drop_rendered(user_id)
+
+    def _drop_rendered(self, user_id: int):
+        """Drop text rendered from a user's (possibly stale) settings."""
+        self._rendered_cache.pop((user_id, "notif"), None)
+        self._rendered_cache.pop((user_id, "rem"), None)
 
     # ==================== MAIN MENU ====================
 
@@ -73,18 +239,17 @@ class BotMenuHandler:
         """Handle /menu command."""
         await self.show_main_menu(update, context, "Головне меню:")
 
+    async def _handle_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Route target for the main-menu callback."""
+        await self.show_main_menu(update, context, "Головне меню:")
+
     async def show_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE, text: str = "Меню:"):
         """Show main menu."""
-        keyboard = [
-            [InlineKeyboardButton("💡 Поточний статус", callback_data=self.CB_STATUS)],
-            [InlineKeyboardButton("📊 Графік на сьогодні", callback_data=self.CB_SCHEDULE_TODAY)],
-            [InlineKeyboardButton("📊 Графік на завтра", callback_data=self.CB_SCHEDULE_TOMORROW)],
-            [InlineKeyboardButton("⚙️ Налаштування", callback_data=self.CB_SETTINGS)],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = self._MAIN_MENU_MARKUP
 
-        if update.callback_query:
-            await update.callback_query.edit_message_text(text, reply_markup=reply_markup)
+        cq = update.callback_query
+        if cq:
+            await cq.edit_message_text(text, reply_markup=reply_markup)
         else:
             await update.message.reply_text(text, reply_markup=reply_markup)
 
@@ -92,25 +257,20 @@ class BotMenuHandler:
 
     async def handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show current power status."""
-        events = self.db.get_events(limit=1)
+        cq = update.callback_query
+        now = time.monotonic()
+        cached_at, events = self._last_event_cache
+        if events is None or now - cached_at > self.LAST_EVENT_TTL:
+            events = await self._db(self.db.get_events, limit=1)
+            self._last_event_cache = (now, events)
 
         if not events:
             text = "📊 Немає даних про статус"
         else:
             last_event = events[0]
-            event_type = last_event['event_type']
-            timestamp = last_event['timestamp']
-            event_time = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
-
-            if event_type == 'online':
-                emoji = "🟢"
-                status = "СВІТЛО ВКЛ"
-            elif event_type == 'offline':
-                emoji = "🔴"
-                status = "СВІТЛО ВИМ"
-            else:
-                emoji = "⚠️"
-                status = "НЕВІДОМО"
+            # time.localtime skips the intermediate datetime object
+            event_time = time.strftime("%H:%M:%S", time.localtime(last_event['timestamp']))
+            emoji, status = _STATUS_MAP.get(last_event['event_type'], ('⚠️', 'НЕВІДОМО'))
 
             duration = last_event.get('duration_seconds')
             duration_str = self.format_duration(duration) if duration else "—"
@@ -121,93 +281,67 @@ class BotMenuHandler:
                 f"⏱️ Тривалість: {duration_str}"
             )
 
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_MAIN_MENU)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await cq.edit_message_text(text, reply_markup=self._BACK_TO_MAIN, parse_mode='HTML')
 
     async def handle_schedule_today(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show today's schedule (placeholder)."""
-        text = (
-            "📊 <b>Графік на сьогодні</b>\n\n"
-            "⚠️ Графік будуть додатися пізніше"
-        )
-
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_MAIN_MENU)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await update.callback_query.edit_message_text(
+            _TXT_SCHEDULE_TODAY, reply_markup=self._BACK_TO_MAIN, parse_mode='HTML')
 
     async def handle_schedule_tomorrow(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show tomorrow's schedule (placeholder)."""
-        text = (
-            "📊 <b>Графік на завтра</b>\n\n"
-            "⚠️ Графік будуть додатися пізніше"
-        )
-
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_MAIN_MENU)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await update.callback_query.edit_message_text(
+            _TXT_SCHEDULE_TOMORROW, reply_markup=self._BACK_TO_MAIN, parse_mode='HTML')
 
     # ==================== LEVEL 2: SETTINGS ====================
 
     async def handle_settings(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show settings menu."""
-        text = "⚙️ <b>Налаштування</b>"
-
-        keyboard = [
-            [InlineKeyboardButton("🔔 Оповіщення в чати", callback_data=self.CB_NOTIFICATIONS)],
-            [InlineKeyboardButton("🔕 Нагадування", callback_data=self.CB_REMINDERS)],
-            [InlineKeyboardButton("🔑 Оновити токен еелінк", callback_data=self.CB_UPDATE_TOKEN)],
-            [InlineKeyboardButton("📝 Логи", callback_data=self.CB_LOGS)],
-            [InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_MAIN_MENU)],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await update.callback_query.edit_message_text(
+            _TXT_SETTINGS, reply_markup=self._SETTINGS_MARKUP, parse_mode='HTML')
 
     async def handle_notifications(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show notifications settings."""
+        cq = update.callback_query
         user_id = update.effective_user.id
-        user_settings = self.get_user_settings(user_id)
-        status = "✅ Включено" if user_settings['notifications_enabled'] else "❌ Відключено"
-
-        text = (
-            f"🔔 <b>Оповіщення в чати</b>\n\n"
-            f"Статус: {status}\n\n"
-            f"Чати: {', '.join(map(str, user_settings['notification_chats'])) or 'Не встановлено'}"
-        )
+        user_settings = await self.get_user_settings(user_id)
 
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_SETTINGS)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        key = (user_id, "notif")
+        text = self._rendered_cache.get(key)
+        if text is None:
+            status = "✅ Включено" if user_settings['notifications_enabled'] else "❌ Відключено"
+            text = (
+                f"🔔 <b>Оповіщення в чати</b>\n\n"
+                f"Статус: {status}\n\n"
+                f"Чати: {user_settings['_notification_chats_str']}"
+            )
+            self._rendered_cache[key] = text
 
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await cq.edit_message_text(text, reply_markup=self._BACK_TO_SETTINGS, parse_mode='HTML')
 
     async def handle_reminders(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show reminders menu."""
+        cq = update.callback_query
         user_id = update.effective_user.id
-        user_settings = self.get_user_settings(user_id)
-        status = "✅ Включено" if user_settings['reminders_enabled'] else "❌ Відключено"
-
-        text = (
-            f"🔕 <b>Нагадування</b>\n\n"
-            f"Статус: {status}"
-        )
+        user_settings = await self.get_user_settings(user_id)
 
-        keyboard = [
-            [InlineKeyboardButton("📊 Час для сьогодні", callback_data=self.CB_REMINDERS_TIME_TODAY)],
-            [InlineKeyboardButton("📊 Час для завтра", callback_data=self.CB_REMINDERS_TIME_TOMORROW)],
-            [InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_SETTINGS)],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        key = (user_id, "rem")
+        text = self._rendered_cache.get(key)
+        if text is None:
+            status = "✅ Включено" if user_settings['reminders_enabled'] else "❌ Відключено"
+            text = (
+                f"🔕 <b>Нагадування</b>\n\n"
+                f"Статус: {status}"
+            )
+            self._rendered_cache[key] = text
 
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await cq.edit_message_text(text, reply_markup=self._REMINDERS_MARKUP, parse_mode='HTML')
 
     async def handle_reminders_time_today(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show time selection for today's reminders."""
+        cq = update.callback_query
         user_id = update.effective_user.id
-        user_settings = self.get_user_settings(user_id)
+        user_settings = await self.get_user_settings(user_id)
         current_time = user_settings['reminder_schedule_today']
 
         text = (
@@ -215,24 +349,14 @@ class BotMenuHandler:
             f"Поточний час: {current_time}"
         )
 
-        # Time options
-        times = ["06:00", "09:00", "12:00", "15:00", "18:00", "21:00"]
-        keyboard = []
-        for i in range(0, len(times), 2):
-            row = [InlineKeyboardButton(times[i], callback_data=f"time_today_{times[i]}")]
-            if i + 1 < len(times):
-                row.append(InlineKeyboardButton(times[i + 1], callback_data=f"time_today_{times[i + 1]}"))
-            keyboard.append(row)
-
-        keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_REMINDERS)])
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await cq.edit_message_text(
+            text, reply_markup=self._TIME_TODAY_MARKUP, parse_mode='HTML')
 
     async def handle_reminders_time_tomorrow(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show time selection for tomorrow's reminders."""
+        cq = update.callback_query
         user_id = update.effective_user.id
-        user_settings = self.get_user_settings(user_id)
+        user_settings = await self.get_user_settings(user_id)
         current_time = user_settings['reminder_schedule_tomorrow']
 
         text = (
@@ -240,100 +364,93 @@ class BotMenuHandler:
             f"Поточний час: {current_time}"
         )
 
-        # Time options
-        times = ["06:00", "09:00", "12:00", "15:00", "18:00", "21:00"]
-        keyboard = []
-        for i in range(0, len(times), 2):
-            row = [InlineKeyboardButton(times[i], callback_data=f"time_tomorrow_{times[i]}")]
-            if i + 1 < len(times):
-                row.append(InlineKeyboardButton(times[i + 1], callback_data=f"time_tomorrow_{times[i + 1]}"))
-            keyboard.append(row)
-
-        keyboard.append([InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_REMINDERS)])
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await cq.edit_message_text(
+            text, reply_markup=self._TIME_TOMORROW_MARKUP, parse_mode='HTML')
 
     async def handle_update_token(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show update token dialog."""
-        text = (
-            "🔑 <b>Оновити токен еелінк</b>\n\n"
-            "⚠️ Функція буде реалізована пізніше"
-        )
-
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_SETTINGS)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await update.callback_query.edit_message_text(
+            _TXT_UPDATE_TOKEN, reply_markup=self._BACK_TO_SETTINGS, parse_mode='HTML')
 
     async def handle_logs(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show logs."""
-        text = (
-            "📝 <b>Логи</b>\n\n"
-            "⚠️ Функція буде реалізована пізніше"
-        )
-
-        keyboard = [[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_SETTINGS)]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode='HTML')
+        await update.callback_query.edit_message_text(
+            _TXT_LOGS, reply_markup=self._BACK_TO_SETTINGS, parse_mode='HTML')
 
     # ==================== CALLBACK ROUTER ====================
 
+    @staticmethod
+    async def _answer_quietly(query):
+        """Ack a callback query; failures are logged, never raised."""
+        try:
+            await query.answer()
+        except Exception as error:
+            logger.warning("Callback answer failed: %s", error)
+
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Route callback queries."""
         query = update.callback_query
-        await query.answer()
-
+        # Best-effort ack running concurrently with the handler - the
+        # edit doesn't need to wait a round-trip for the button spinner
+        # to clear
+        ack = asyncio.create_task(self._answer_quietly(query))
+        try:
+            await self._dispatch_callback(update, context, query)
+        finally:
+            await ack
+
+    async def _dispatch_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE, query):
+        """Run the handler matching the callback payload."""
         callback_data = query.data
 
-        # Main menu
-        if callback_data == self.CB_MAIN_MENU:
-            await self.show_main_menu(update, context, "Головне меню:")
-
-        # Level 1
-        elif callback_data == self.CB_STATUS:
-            await self.handle_status(update, context)
-        elif callback_data == self.CB_SCHEDULE_TODAY:
-            await self.handle_schedule_today(update, context)
-        elif callback_data == self.CB_SCHEDULE_TOMORROW:
-            await self.handle_schedule_tomorrow(update, context)
-
-        # Level 2
-        elif callback_data == self.CB_SETTINGS:
-            await self.handle_settings(update, context)
-        elif callback_data == self.CB_NOTIFICATIONS:
-            await self.handle_notifications(update, context)
-        elif callback_data == self.CB_REMINDERS:
-            await self.handle_reminders(update, context)
-        elif callback_data == self.CB_UPDATE_TOKEN:
-            await self.handle_update_token(update, context)
-        elif callback_data == self.CB_LOGS:
-            await self.handle_logs(update, context)
-
-        # Level 3
-        elif callback_data == self.CB_REMINDERS_TIME_TODAY:
-            await self.handle_reminders_time_today(update, context)
-        elif callback_data == self.CB_REMINDERS_TIME_TOMORROW:
-            await self.handle_reminders_time_tomorrow(update, context)
-
-        # Time selections
-        elif callback_data.startswith("time_today_"):
+        handler = self._routes.get(callback_data)
+        if handler is not None:
+            await handler(update, context)
+            return
+
+        decoded = self._TIME_DECODE.get(callback_data)
+        if decoded is not None:
+            kind, time_value = decoded
+            user_id = update.effective_user.id
+            self._invalidate_user_settings(user_id)
+            if kind == "today":
+                setter = self._set_today
+                confirm = f"✅ Час для сьогодні встановлено: {time_value}"
+            else:
+                setter = self._set_tomorrow
+                confirm = f"✅ Час для завтра встановлено: {time_value}"
+            await asyncio.gather(
+                asyncio.to_thread(setter, user_id, time_value),
+                query.edit_message_text(confirm, reply_markup=self._BACK_TO_REMINDERS),
+            )
+            return
+
+        # Legacy long-form payloads - keyboards rendered before the
+        # short codes shipped may still be on screen
+        if callback_data.startswith("time_today_"):
             time_value = callback_data.replace("time_today_", "")
             user_id = update.effective_user.id
-            self.db.set_reminder_schedule_today(user_id, time_value)
-            await query.edit_message_text(
-                f"✅ Час для сьогодні встановлено: {time_value}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_REMINDERS)]])
+            # Invalidate before the write is scheduled so a concurrent
+            # read can't re-cache the old row
+            self._invalidate_user_settings(user_id)
+            await asyncio.gather(
+                asyncio.to_thread(self._set_today, user_id, time_value),
+                query.edit_message_text(
+                    f"✅ Час для сьогодні встановлено: {time_value}",
+                    reply_markup=self._BACK_TO_REMINDERS
+                ),
             )
 
         elif callback_data.startswith("time_tomorrow_"):
             time_value = callback_data.replace("time_tomorrow_", "")
             user_id = update.effective_user.id
-            self.db.set_reminder_schedule_tomorrow(user_id, time_value)
-            await query.edit_message_text(
-                f"✅ Час для завтра встановлено: {time_value}",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Назад", callback_data=self.CB_REMINDERS)]])
+            self._invalidate_user_settings(user_id)
+            await asyncio.gather(
+                asyncio.to_thread(self._set_tomorrow, user_id, time_value),
+                query.edit_message_text(
+                    f"✅ Час для завтра встановлено: {time_value}",
+                    reply_markup=self._BACK_TO_REMINDERS
+                ),
             )
 
     def format_duration(self, seconds: int) -> str:
@@ -341,16 +458,13 @@ class BotMenuHandler:
         if not seconds:
             return "0 хв"
 
-        total_minutes = seconds // 60
-        total_hours = total_minutes // 60
-        days = total_hours // 24
-        hours = total_hours % 24
-        minutes = total_minutes % 60
+        total_hours, minutes = divmod(seconds // 60, 60)
+        days, hours = divmod(total_hours, 24)
 
         parts = []
 
         if days > 0:
-            day_word = 'день' if days == 1 else ('дні' if 2 <= days <= 4 else 'днів')
+            day_word = _DAY_WORDS[0 if days == 1 else (1 if 2 <= days <= 4 else 2)]
             parts.append(f"{days} {day_word}")
 
         if hours > 0:
@@ -363,6 +477,9 @@ class BotMenuHandler:
 
     async def setup_commands(self):
         """Set bot commands."""
+        # Only needed once at startup - not worth a module-level import
+        from telegram import BotCommand
+
         commands = [
             BotCommand("start", "Початок"),
             BotCommand("menu", "Меню"),
@@ -396,5 +513,4 @@ async def run_bot():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(run_bot())
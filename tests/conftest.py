@@ -0,0 +1,30 @@
+"""Shared fixtures for the test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from pytest import MonkeyPatch
+
+# Resolved once per pytest worker so test modules can import straight
+# from src without repeating the path setup themselves
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+@pytest.fixture(scope="module")
+def bot():
+    """TelegramBot built once per module against a patched environment.
+
+    Replaces the per-test patch.dict blocks: the env snapshot/restore
+    and the bot construction happen once instead of once per test.
+    """
+    mp = MonkeyPatch()
+    mp.setenv("TELEGRAM_BOT_TOKEN", "test_token_123")
+    mp.setenv("TELEGRAM_CHAT_ID", "123456789")
+
+    from telegram_bot import TelegramBot
+
+    yield TelegramBot()
+    mp.undo()
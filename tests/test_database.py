@@ -0,0 +1,73 @@
+"""Tests for the database module."""
+
+import sqlite3
+import time
+
+from database import PowerMonitorDB
+
+
+def _create_legacy_db(db_path, rows):
+    """Build a database with the original pre-migration schema.
+
+    event_type is stored as TEXT and event_datetime as an ordinary
+    stored column, with the original two indexes — the shape every
+    production database had before the integer-code migration.
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE power_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            event_datetime TEXT NOT NULL,
+            duration_seconds INTEGER,
+            message TEXT,
+            draft_confirmed BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX idx_power_events_timestamp
+        ON power_events(timestamp DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX idx_power_events_event_type
+        ON power_events(event_type)
+    ''')
+    cursor.executemany('''
+        INSERT INTO power_events
+            (event_type, timestamp, event_datetime, duration_seconds, message)
+        VALUES (?, ?, datetime(?, 'unixepoch'), ?, ?)
+    ''', [(etype, ts, ts, duration, message)
+          for etype, ts, duration, message in rows])
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_schema_migration(tmp_path):
+    """Opening a pre-migration database converts it without data loss."""
+    db_path = tmp_path / 'legacy.db'
+    now = int(time.time())
+    _create_legacy_db(db_path, [
+        ('offline', now - 700, None, 'Power lost'),
+        ('online', now - 100, 600, 'Power restored'),
+    ])
+
+    db = PowerMonitorDB(db_path=db_path)
+    try:
+        # Column migrated to integer codes, reads still return names
+        cursor = db._conn.execute('PRAGMA table_info(power_events)')
+        column_types = {row[1]: row[2] for row in cursor.fetchall()}
+        assert column_types['event_type'] == 'INTEGER'
+
+        events = db.get_events(limit=10)
+        assert [e['event_type'] for e in events] == ['online', 'offline']
+
+        # Typed filter uses the migrated integer codes
+        offline = db.get_events(limit=10, event_type='offline',
+                                include_message=True)
+        assert len(offline) == 1
+        assert offline[0]['message'] == 'Power lost'
+    finally:
+        db.close()
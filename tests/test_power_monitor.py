@@ -155,7 +155,7 @@ class TestPowerStatusCheck:
     async def test_check_power_status_online(self, power_monitor):
         """Test checking power status when device is online."""
         mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value={
+        mock_response.content = json.dumps({
             'error': 0,
             'data': {
                 'thingList': [{
@@ -165,16 +165,13 @@ class TestPowerStatusCheck:
                     }
                 }]
             }
-        })
+        }).encode()
         
         with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock()
-            
+            mock_client_class.return_value.post = AsyncMock(return_value=mock_response)
+
             result = await power_monitor.check_power_status()
-            
+
             assert result['online'] == True
             assert 'timestamp' in result
             print("✓ Check power status (online) test passed")
@@ -183,7 +180,7 @@ class TestPowerStatusCheck:
     async def test_check_power_status_offline(self, power_monitor):
         """Test checking power status when device is offline."""
         mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value={
+        mock_response.content = json.dumps({
             'error': 0,
             'data': {
                 'thingList': [{
@@ -193,16 +190,13 @@ class TestPowerStatusCheck:
                     }
                 }]
             }
-        })
+        }).encode()
         
         with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock()
-            
+            mock_client_class.return_value.post = AsyncMock(return_value=mock_response)
+
             result = await power_monitor.check_power_status()
-            
+
             assert result['online'] == False
             print("✓ Check power status (offline) test passed")
 